@@ -16,74 +16,153 @@ Specify custom player / enemy files::
                    --skills data/example_skills.json
 """
 
-import argparse
-import json
+import re
+import sys
 from pathlib import Path
+from typing import List, NoReturn, Optional
 
 from rpg.battle import Battle
+from rpg.jsonio import dumps
 from rpg.loader import load_characters_from_file, load_skills_from_file
 
 _DATA_DIR = Path(__file__).parent / "data"
 
 
-def _enemy_info(enemies: list) -> list:
-    """Return a JSON-serialisable list of enemy stats (pre-battle snapshot)."""
-    return [
-        {
-            "name": e.name,
-            "max_hp": e.max_hp,
-            "max_sp": e.max_sp,
-            "atk": e.atk,
-            "rcv": e.rcv,
-            "speed": e.speed,
-            "action_count": e.action_count,
-            "skills": [s.to_dict() for s in e.skills],
-        }
-        for e in enemies
-    ]
+_USAGE = """\
+usage: main.py [-h] [--skills FILE] [--output {enemy_info,battle}]
+               [--player FILE] [--enemies FILE]
 
+Python RPG Battle System
 
-def main() -> None:
-    # こういう形で実行時引数を1つずつ指定できるようだ
-    parser = argparse.ArgumentParser(description="Python RPG Battle System")
-    parser.add_argument(
-        "--skills", "-s",
-        metavar="FILE",
-        help="JSON file containing the player's skill list",
-    )
-    parser.add_argument(
-        "--output", "-o",
-        choices=["enemy_info", "battle"],
-        default="battle",
-        help="'enemy_info' outputs pre-battle enemy stats; 'battle' runs the battle (default)",
-    )
-    parser.add_argument(
-        "--player", "-p",
-        metavar="FILE",
-        default=str(_DATA_DIR / "player.json"),
-        help="JSON file for the player character (default: data/player.json)",
-    )
-    parser.add_argument(
-        "--enemies", "-e",
-        metavar="FILE",
-        default=str(_DATA_DIR / "enemies.json"),
-        help="JSON file for the enemy roster (default: data/enemies.json)",
+options:
+  -h, --help            show this help message and exit
+  --skills FILE, -s FILE
+                        JSON file containing the player's skill list
+  --output {enemy_info,battle}, -o {enemy_info,battle}
+                        'enemy_info' outputs pre-battle enemy stats; 'battle' runs the battle (default)
+  --player FILE, -p FILE
+                        JSON file for the player character (default: data/player.json)
+  --enemies FILE, -e FILE
+                        JSON file for the enemy roster (default: data/enemies.json)
+"""
+
+_OPTIONS = {
+    "--skills": "skills", "-s": "skills",
+    "--output": "output", "-o": "output",
+    "--player": "player", "-p": "player",
+    "--enemies": "enemies", "-e": "enemies",
+}
+_LONG_OPTIONS = sorted(o for o in [*_OPTIONS, "--help"] if o.startswith("--"))
+_OUTPUT_CHOICES = ("enemy_info", "battle")
+# Tokens argparse reads as negative numbers (values) rather than options
+_NEGATIVE_NUMBER = re.compile(r"^-\d+$|^-\d*\.\d+$")
+
+
+def _usage_error(message: str) -> NoReturn:
+    sys.stderr.write(_USAGE.split("\n\n", 1)[0] + f"\nmain.py: error: {message}\n")
+    sys.exit(2)
+
+
+def _option_names(key: str) -> str:
+    """Return e.g. ``"--skills/-s"`` for *key*, as argparse names arguments."""
+    return "/".join(o for o, k in _OPTIONS.items() if k == key)
+
+
+def _looks_like_option(token: str) -> bool:
+    """Return True if argparse would read *token* as an option, not a value."""
+    return (
+        token.startswith("-")
+        and token != "-"
+        and " " not in token
+        and not _NEGATIVE_NUMBER.match(token)
     )
-    args = parser.parse_args()
-    # --を取っ払ったものをattributeとして取得可能
-    player = load_characters_from_file(args.player)[0]
-    enemies = load_characters_from_file(args.enemies)
+
+
+def _resolve_long(name: str) -> Optional[str]:
+    """Expand *name* if it is a long option or a unique prefix of one."""
+    if name in _LONG_OPTIONS:
+        return name
+    matches = [o for o in _LONG_OPTIONS if o.startswith(name)]
+    if len(matches) > 1:
+        _usage_error(f"ambiguous option: {name} could match {', '.join(matches)}")
+    return matches[0] if matches else None
+
+
+def _parse_args(argv: List[str]) -> dict:
+    """Parse command-line options (a minimal stand-in for argparse).
+
+    Accepts the same forms argparse did: ``--skills FILE``,
+    ``--skills=FILE``, unique prefixes such as ``--sk FILE``, and
+    ``-s FILE``, ``-sFILE`` or ``-s=FILE``.
+    """
+    args = {
+        "skills": None,
+        "output": "battle",
+        "player": str(_DATA_DIR / "player.json"),
+        "enemies": str(_DATA_DIR / "enemies.json"),
+    }
+    extras: List[str] = []
+    i = 0
+    while i < len(argv):
+        token = argv[i]
+        i += 1
+        if token == "--":
+            # Everything after "--" is positional, and we take none
+            extras.extend(argv[i - 1:])
+            break
+        if not _looks_like_option(token):
+            extras.append(token)
+            continue
+        value: Optional[str]
+        if token.startswith("--"):
+            name, sep, value = token.partition("=")
+            option = _resolve_long(name)
+            if not sep:
+                value = None
+        else:
+            option, attached = token[:2], token[2:]
+            value = attached[1:] if attached.startswith("=") else attached or None
+        if option in ("-h", "--help"):
+            sys.stdout.write(_USAGE)
+            sys.exit(0)
+        key = _OPTIONS.get(option)
+        if key is None:
+            extras.append(token)
+            continue
+        if value is None:
+            if i == len(argv) or _looks_like_option(argv[i]):
+                _usage_error(f"argument {_option_names(key)}: expected one argument")
+            value = argv[i]
+            i += 1
+        args[key] = value
+
+    if args["output"] not in _OUTPUT_CHOICES:
+        _usage_error(
+            f"argument {_option_names('output')}: invalid choice: {args['output']!r} "
+            f"(choose from {', '.join(map(repr, _OUTPUT_CHOICES))})"
+        )
+    if extras:
+        _usage_error(f"unrecognized arguments: {' '.join(extras)}")
+    return args
+
+
+def main() -> None:
+    # 実行時引数は--skills FILEのようにオプションと値の組で1つずつ指定する
+    args = _parse_args(sys.argv[1:])
+    # --を取っ払ったものをキーとして取得可能
+    player = load_characters_from_file(args["player"])[0]
+    enemies = load_characters_from_file(args["enemies"])
     # 出力としてenemy_infoを指定した場合敵の情報をJSON形式で出力する
-    if args.output == "enemy_info":
-        print(json.dumps(_enemy_info(enemies), ensure_ascii=False, indent=2))
+    if args["output"] == "enemy_info":
+        # Characterはdumpsのdefaultフック(to_dict)でそのままシリアライズされる
+        sys.stdout.buffer.write(dumps(enemies, indent=True) + b"\n")
         return
 
-    if args.skills:
-        player.skills = load_skills_from_file(args.skills)
+    if args["skills"]:
+        player.skills = load_skills_from_file(args["skills"])
 
-    battle = Battle(player, enemies)
-    result = battle.run()
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    # ターンごとに逐次出力する(ログ全体をメモリに溜めない)
+    Battle(player, enemies).run_streaming(sys.stdout.buffer)
 
 
 if __name__ == "__main__":
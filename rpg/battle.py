@@ -1,12 +1,27 @@
 """Automatic turn-based battle engine."""
 
-from typing import Any, Dict, List, Optional
+import sys
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
 
-from .models import Character, Effect, StatusEffect
+from .jsonio import dumps
+from .models import Character, Effect, Skill, StatusEffect
 
 
 _MAX_TURNS = 100  # safety cap to prevent infinite loops
 
+# Effect types, interned to match the strings produced by rpg.loader
+_DAMAGE = sys.intern("damage")
+_HEAL = sys.intern("heal")
+_STATUS = sys.intern("status")
+
+# (battle, actor, effect) -> effect log entry, or None when there is no target
+_EffectHandler = Callable[["Battle", Character, Effect], Optional[Dict[str, Any]]]
+# A skill's effects paired with their handlers
+_SkillPlan = List[Tuple[_EffectHandler, Effect]]
+# Per actor, in acting order: (actor, number of skills, serialised skills,
+# effect handlers per skill)
+_ActorPlan = Tuple[Character, int, List[Dict[str, Any]], List[_SkillPlan]]
+
 
 class Battle:
     """Runs a single battle between *player* and a list of *enemies*.
@@ -15,122 +30,233 @@ class Battle:
     1. Each turn, all living characters act in descending speed order.
     2. Each character executes one skill per action, selecting the skill by
        cycling through their skill list based on total actions taken in battle.
-    3. Each skill's effects are resolved in order:
+    3. Each skill's effects are resolved in order (handlers are looked up by
+       effect type once, when the battle starts):
        - ``"damage"``  → deal ``atk * coefficient`` HP damage to the target.
        - ``"heal"``    → restore ``rcv * coefficient`` HP to the actor.
        - ``"status"``  → apply a named status effect (magnitude = coefficient,
                          default duration = 3 turns) to the target.
     4. At the end of every turn, status-effect durations are decremented and
        expired effects are removed.
-    5. The battle ends when either the player or all enemies are defeated, or
+    5. The log lists each character's fixed stats (max HP/SP, skills) once
+       under ``"characters"``; per-turn snapshots only carry HP, SP and
+       status effects.
+    6. The battle ends when either the player or all enemies are defeated, or
        after :data:`_MAX_TURNS` turns (draw).
     """
 
     def __init__(self, player: Character, enemies: List[Character]) -> None:
         self.player = player
         self.enemies = enemies
-        self._turn_logs: List[Dict[str, Any]] = []
+        # Per-battle state, (re)initialised by _start() so changes made to the
+        # characters or the roster after construction are honoured
+        self._all_chars: List[Character] = []
+        self._alive_enemies: int = 0
+        self._first_alive_idx: int = 0
+        self._over: bool = False
+        self._actor_plans: List[_ActorPlan] = []
+        self._static_info: List[Dict[str, Any]] = []
 
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
-    def _living_enemies(self) -> List[Character]:
-        return [e for e in self.enemies if e.is_alive()]
-
-    def _is_over(self) -> bool:
-        return not self.player.is_alive() or not self._living_enemies()
-
     def _get_target(self, actor: Character) -> Optional[Character]:
         """Return the first valid target for *actor*."""
         if actor is self.player:
-            living = self._living_enemies()
-            return living[0] if living else None
+            if self._alive_enemies == 0:
+                return None
+            while not self.enemies[self._first_alive_idx].is_alive():
+                self._first_alive_idx += 1
+            return self.enemies[self._first_alive_idx]
         return self.player if self.player.is_alive() else None
 
-    def _apply_effect(
-        self,
-        actor: Character,
-        effect: Effect,
-        offensive_target: Character,
-    ) -> Dict[str, Any]:
-        """Resolve a single effect and return a result dict."""
-        result: Dict[str, Any] = {
-            "effect_type": effect.effect_type,
-            "coefficient": effect.coefficient,
-        }
+    @staticmethod
+    def _effect_result(effect: Effect) -> Dict[str, Any]:
+        return {"effect_type": effect.effect_type, "coefficient": effect.coefficient}
 
-        if effect.effect_type == "damage":
-            amount = int(actor.atk * effect.coefficient)
-            actual = offensive_target.take_damage(amount)
-            result["target"] = offensive_target.name
-            result["damage"] = actual
-
-        elif effect.effect_type == "heal":
-            amount = int(actor.rcv * effect.coefficient)
-            actual = actor.heal_hp(amount)
-            result["target"] = actor.name
-            result["healed"] = actual
-
-        elif effect.effect_type == "status":
-            se = StatusEffect(
-                name=effect.status_name or "unknown",
-                magnitude=effect.coefficient,
-                duration=3,
-            )
-            offensive_target.apply_status(se)
-            result["target"] = offensive_target.name
-            result["status_name"] = se.name
-            result["magnitude"] = se.magnitude
+    def _apply_damage(self, actor: Character, effect: Effect) -> Optional[Dict[str, Any]]:
+        """Deal damage to the actor's target; ``None`` if there is no target."""
+        target = self._get_target(actor)
+        if target is None:
+            return None
+        amount = int(actor.atk * effect.coefficient)
+        actual = target.take_damage(amount)
+        if not target.is_alive():
+            if target is not self.player:
+                self._alive_enemies -= 1
+            self._over = not self.player.is_alive() or self._alive_enemies == 0
+        result = self._effect_result(effect)
+        result["target"] = target.name
+        result["damage"] = actual
+        return result
 
+    def _apply_heal(self, actor: Character, effect: Effect) -> Optional[Dict[str, Any]]:
+        """Heal the actor (heals always target self)."""
+        amount = int(actor.rcv * effect.coefficient)
+        actual = actor.heal_hp(amount)
+        result = self._effect_result(effect)
+        result["target"] = actor.name
+        result["healed"] = actual
         return result
 
-    def _execute_skill(self, actor: Character, skill_index: int) -> Dict[str, Any]:
-        """Execute one skill and return its action log entry."""
-        skill = actor.skills[skill_index]
+    def _apply_status(self, actor: Character, effect: Effect) -> Optional[Dict[str, Any]]:
+        """Apply a status effect to the actor's target; ``None`` if there is no target."""
         target = self._get_target(actor)
+        if target is None:
+            return None
+        se = StatusEffect(
+            name=effect.status_name or "unknown",
+            magnitude=effect.coefficient,
+            duration=3,
+        )
+        target.apply_status(se)
+        result = self._effect_result(effect)
+        result["target"] = target.name
+        result["status_name"] = se.name
+        result["magnitude"] = se.magnitude
+        return result
+
+    def _apply_unknown(self, actor: Character, effect: Effect) -> Optional[Dict[str, Any]]:
+        """Log an unrecognised effect type without resolving it."""
+        return self._effect_result(effect)
+
+    _EFFECT_HANDLERS: Dict[str, _EffectHandler] = {
+        _DAMAGE: _apply_damage,
+        _HEAL: _apply_heal,
+        _STATUS: _apply_status,
+    }
+
+    def _compile_skill(self, skill: Skill) -> _SkillPlan:
+        """Pair each effect of *skill* with its handler, resolved once per battle."""
+        return [
+            (self._EFFECT_HANDLERS.get(effect.effect_type, Battle._apply_unknown), effect)
+            for effect in skill.effects
+        ]
+
+    def _execute_skill(
+        self,
+        actor: Character,
+        skill_dict: Dict[str, Any],
+        plan: _SkillPlan,
+    ) -> Dict[str, Any]:
+        """Execute one skill and return its action log entry.
+
+        *skill_dict* and *plan* are the skill's serialised form and compiled
+        effects, both prepared by :meth:`_start`.  *actor* must be alive.  No effect damages its own user (damage and
+        status effects hit the other side, heals only restore HP), so the
+        actor stays alive for the whole skill and is not re-checked.
+        """
         effects_log: List[Dict[str, Any]] = []
 
-        for effect in skill.effects:
-            if not actor.is_alive():
+        for apply, effect in plan:
+            result = apply(self, actor, effect)
+            if result is None:  # no living target left
                 break
-            if effect.effect_type in ("damage", "status"):
-                # Re-query target in case the previous effect killed it
-                if target is None or not target.is_alive():
-                    target = self._get_target(actor)
-                if target is None:
-                    break
-                effects_log.append(self._apply_effect(actor, effect, target))
-            else:  # "heal" – always targets self
-                effects_log.append(self._apply_effect(actor, effect, actor))
+            effects_log.append(result)
 
         return {
             "actor": actor.name,
-            "skill": skill.to_dict(),
+            "skill": skill_dict,
             "effects": effects_log,
         }
 
     def _snapshot(self) -> List[Dict[str, Any]]:
-        """Snapshot HP/SP/status of all characters."""
-        chars = [self.player] + self.enemies
+        """Snapshot the mutable HP/SP/status of all characters."""
         return [
             {
                 "name": c.name,
                 "hp": c.hp,
-                "max_hp": c.max_hp,
                 "sp": c.sp,
-                "max_sp": c.max_sp,
                 "status_effects": [se.to_dict() for se in c.status_effects],
             }
-            for c in chars
+            for c in self._all_chars
         ]
 
     def _tick_status_effects(self) -> None:
         """Decrement duration of all active status effects; remove expired ones."""
-        for char in [self.player] + self.enemies:
-            char.status_effects = [se for se in char.status_effects if se.duration > 0]
-            for se in char.status_effects:
-                se.duration -= 1
+        for char in self._all_chars:
+            char.tick_status_effects()
+
+    def _play_turn(self, turn_number: int) -> Dict[str, Any]:
+        """Play one turn and return its log entry."""
+        # Characters act in descending speed order, at most once each
+        acting_order = [entry for entry in self._actor_plans if entry[0].is_alive()]
+        actions: List[Optional[Dict[str, Any]]] = [None] * len(acting_order)
+        n_actions = 0
+        turn_log: Dict[str, Any] = {
+            "turn": turn_number,
+            "status_at_start": self._snapshot(),
+            "actions": actions,
+        }
+
+        for actor, n_skills, skill_dicts, plans in acting_order:
+            if not actor.is_alive() or self._over:
+                break
+            if n_skills:
+                skill_index = actor.action_count % n_skills
+                actions[n_actions] = self._execute_skill(
+                    actor, skill_dicts[skill_index], plans[skill_index]
+                )
+                n_actions += 1
+                actor.action_count += 1
+
+        del actions[n_actions:]
+        self._tick_status_effects()
+        return turn_log
+
+    def _start(self) -> None:
+        """Reset per-battle state from the characters as they are now."""
+        self._all_chars = [self.player] + self.enemies
+        for character in self._all_chars:
+            character.action_count = 0
+        # Enemies only ever die (nothing revives them), so a counter and a
+        # pointer to the first living enemy replace rescanning the roster
+        self._alive_enemies = sum(1 for e in self.enemies if e.is_alive())
+        self._first_alive_idx = 0
+        # Whether the battle is decided; only changes when a character dies
+        self._over = not self.player.is_alive() or self._alive_enemies == 0
+        # Speed never changes during battle, so the acting order is sorted
+        # once and per-actor invariants are hoisted out of the turn loop.
+        # Skills are serialised here rather than on every action; the dicts
+        # are fresh per battle, so log entries never alias the models or
+        # another run's log
+        self._actor_plans = [
+            (
+                c,
+                len(c.skills),
+                [s.to_dict() for s in c.skills],
+                [self._compile_skill(s) for s in c.skills],
+            )
+            for c in sorted(self._all_chars, key=lambda c: c.speed, reverse=True)
+        ]
+        # Stats that never change during battle are logged once, not per turn
+        self._static_info = [
+            {
+                "name": c.name,
+                "max_hp": c.max_hp,
+                "max_sp": c.max_sp,
+                "skills": [s.to_dict() for s in c.skills],
+            }
+            for c in self._all_chars
+        ]
+
+    def _iter_turns(self) -> Iterator[Dict[str, Any]]:
+        """Play the battle, yielding each turn's log entry as it completes.
+
+        :meth:`_start` must have been called first.
+        """
+        turn_number = 0
+        while not self._over and turn_number < _MAX_TURNS:
+            turn_number += 1
+            yield self._play_turn(turn_number)
+
+    def _outcome(self) -> str:
+        if self.player.is_alive() and self._alive_enemies == 0:
+            return "player_win"
+        if not self.player.is_alive():
+            return "player_lose"
+        return "draw"
 
     # ------------------------------------------------------------------
     # Public API
@@ -138,42 +264,47 @@ class Battle:
 
     def run(self) -> Dict[str, Any]:
         """Execute the battle and return the full log as a JSON-serialisable dict."""
+        self._start()
+        # Preallocated to the turn cap and trimmed once the battle ends
+        turn_logs: List[Optional[Dict[str, Any]]] = [None] * _MAX_TURNS
         turn_number = 0
-        for character in [self.player] + self.enemies:
-            character.action_count = 0
-
-        while not self._is_over() and turn_number < _MAX_TURNS:
+        for turn_log in self._iter_turns():
+            turn_logs[turn_number] = turn_log
             turn_number += 1
-            turn_log: Dict[str, Any] = {
-                "turn": turn_number,
-                "status_at_start": self._snapshot(),
-                "actions": [],
-            }
+        del turn_logs[turn_number:]
 
-            # Characters act in descending speed order
-            acting_order = sorted(
-                [c for c in [self.player] + self.enemies if c.is_alive()],
-                key=lambda c: c.speed,
-                reverse=True,
-            )
+        return {"result": self._outcome(), "characters": self._static_info, "turns": turn_logs}
 
-            for actor in acting_order:
-                if not actor.is_alive() or self._is_over():
-                    break
-                if actor.skills:
-                    skill_index = actor.action_count % len(actor.skills)
-                    turn_log["actions"].append(self._execute_skill(actor, skill_index))
-                    actor.action_count += 1
-
-            self._tick_status_effects()
-            self._turn_logs.append(turn_log)
-
-        # Determine outcome
-        if self.player.is_alive() and not self._living_enemies():
-            result = "player_win"
-        elif not self.player.is_alive():
-            result = "player_lose"
-        else:
-            result = "draw"
-
-        return {"result": result, "turns": self._turn_logs}
+    def run_streaming(self, out: Optional[BinaryIO] = None) -> str:
+        """Execute the battle, writing the log to *out* as JSON turn by turn.
+
+        Each turn is serialised and written as soon as it completes, so the
+        full log is never held in memory.  The document has the same keys as
+        :meth:`run`, with ``"result"`` last, and one turn per line.  *out*
+        defaults to ``sys.stdout.buffer``.  Returns the result string.
+        """
+        if out is None:
+            out = sys.stdout.buffer
+        self._start()
+        out.write(b'{"characters":' + dumps(self._static_info) + b',"turns":[')
+        separator = b"\n"
+        for turn_log in self._iter_turns():
+            out.write(separator + dumps(turn_log))
+            separator = b",\n"
+        result = self._outcome()
+        out.write(b'\n],"result":' + dumps(result) + b"}\n")
+        return result
+
+    def run_fast(self) -> Dict[str, Any]:
+        """Execute the battle without logging and return only ``{"result": ...}``.
+
+        Uses the compiled simulation in :mod:`rpg.battle_jit` (requires NumPy;
+        Numba makes it fast).  Intended for running many battles, e.g. for
+        balance tuning.  Use :meth:`run` when the turn log is needed.
+        """
+        from .battle_jit import simulate
+
+        chars = [self.player] + self.enemies
+        # Stable sort, so speed ties keep roster order exactly as in run()
+        order = sorted(range(len(chars)), key=lambda i: chars[i].speed, reverse=True)
+        return {"result": simulate(chars, order, _MAX_TURNS)}
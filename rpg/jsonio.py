@@ -0,0 +1,45 @@
+"""JSON encoding/decoding helpers for the RPG battle system.
+
+Uses :mod:`orjson` when it is installed and falls back to the standard
+library :mod:`json` module otherwise.  Both paths produce UTF-8 bytes.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Serialise model objects (Effect, Skill, StatusEffect, Character) via ``to_dict``."""
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode *obj* as UTF-8 JSON bytes, optionally indented by 2 spaces."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+    # Separators chosen so both paths produce the same bytes
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=(",", ": ") if indent else (",", ":"),
+        default=_default,
+    ).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document from UTF-8 *data*."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
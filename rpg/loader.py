@@ -1,8 +1,9 @@
 """JSON loading utilities for the RPG battle system."""
 
-import json
-from typing import Any, Dict, List
+import sys
+from typing import Any, Dict, List, Optional
 
+from .jsonio import loads
 from .models import Character, Effect, Skill, StatusEffect
 
 
@@ -10,23 +11,30 @@ from .models import Character, Effect, Skill, StatusEffect
 # Primitive loaders
 # ---------------------------------------------------------------------------
 
+# Names and effect types are interned so the equality checks and dict
+# lookups made during battle can succeed on identity.
+
+
+def _intern_optional(value: Optional[str]) -> Optional[str]:
+    return None if value is None else sys.intern(value)
+
 
 def load_effect_from_dict(data: Dict[str, Any]) -> Effect:
     return Effect(
-        effect_type=data["effect_type"],
+        effect_type=sys.intern(data["effect_type"]),
         coefficient=float(data["coefficient"]),
-        status_name=data.get("status_name"),
+        status_name=_intern_optional(data.get("status_name")),
     )
 
 
 def load_skill_from_dict(data: Dict[str, Any]) -> Skill:
     effects = [load_effect_from_dict(e) for e in data.get("effects", [])]
-    return Skill(name=data["name"], effects=effects)
+    return Skill(name=sys.intern(data["name"]), effects=effects)
 
 
 def load_status_effect_from_dict(data: Dict[str, Any]) -> StatusEffect:
     return StatusEffect(
-        name=data["name"],
+        name=sys.intern(data["name"]),
         magnitude=float(data["magnitude"]),
         duration=int(data["duration"]),
     )
@@ -36,23 +44,22 @@ def load_character_from_dict(data: Dict[str, Any]) -> Character:
     """Create a :class:`Character` from a plain dictionary."""
     skills = [load_skill_from_dict(s) for s in data.get("skills", [])]
     status_effects = [load_status_effect_from_dict(se) for se in data.get("status_effects", [])]
-    char = Character(
+    max_hp = int(data["max_hp"])
+    max_sp = int(data["max_sp"])
+    # Callers may supply a current HP/SP that differs from max
+    return Character._fast_new(
         name=data["name"],
-        max_hp=int(data["max_hp"]),
-        max_sp=int(data["max_sp"]),
+        max_hp=max_hp,
+        max_sp=max_sp,
         atk=int(data["atk"]),
         rcv=int(data["rcv"]),
         speed=int(data["speed"]),
         action_count=int(data["action_count"]),
         skills=skills,
         status_effects=status_effects,
+        hp=int(data["hp"]) if "hp" in data else max_hp,
+        sp=int(data["sp"]) if "sp" in data else max_sp,
     )
-    # Allow callers to supply a current HP/SP that differs from max
-    if "hp" in data:
-        char.hp = int(data["hp"])
-    if "sp" in data:
-        char.sp = int(data["sp"])
-    return char
 
 
 # ---------------------------------------------------------------------------
@@ -62,8 +69,8 @@ def load_character_from_dict(data: Dict[str, Any]) -> Character:
 
 def load_characters_from_file(path: str) -> List[Character]:
     """Load one or more characters from a JSON file (dict or list of dicts)."""
-    with open(path, "r", encoding="utf-8") as fh:
-        raw = json.load(fh)
+    with open(path, "rb") as fh:
+        raw = loads(fh.read())
     if isinstance(raw, list):
         return [load_character_from_dict(d) for d in raw]
     return [load_character_from_dict(raw)]
@@ -71,8 +78,8 @@ def load_characters_from_file(path: str) -> List[Character]:
 
 def load_skills_from_file(path: str) -> List[Skill]:
     """Load a list of skills from a JSON file (single dict or list of dicts)."""
-    with open(path, "r", encoding="utf-8") as fh:
-        raw = json.load(fh)
+    with open(path, "rb") as fh:
+        raw = loads(fh.read())
     if isinstance(raw, list):
         return [load_skill_from_dict(s) for s in raw]
     return [load_skill_from_dict(raw)]
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Effect:
     """A single effect within a skill.
 
@@ -25,7 +25,7 @@ class Effect:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class Skill:
     """A skill composed of one or more effects executed in order."""
 
@@ -36,7 +36,7 @@ class Skill:
         return {"name": self.name, "effects": [e.to_dict() for e in self.effects]}
 
 
-@dataclass
+@dataclass(slots=True)
 class StatusEffect:
     """A status condition applied to a character."""
 
@@ -48,7 +48,7 @@ class StatusEffect:
         return {"name": self.name, "magnitude": self.magnitude, "duration": self.duration}
 
 
-@dataclass
+@dataclass(slots=True)
 class Character:
     """A battle participant (player or enemy)."""
 
@@ -61,10 +61,47 @@ class Character:
     action_count: int
     skills: List[Skill] = field(default_factory=list)
     status_effects: List[StatusEffect] = field(default_factory=list)
+    # Current HP/SP start at their maximums; declared so they get a slot
+    hp: int = field(init=False)
+    sp: int = field(init=False)
 
     def __post_init__(self) -> None:
-        self.hp: int = self.max_hp
-        self.sp: int = self.max_sp
+        self.hp = self.max_hp
+        self.sp = self.max_sp
+
+    @classmethod
+    def _fast_new(
+        cls,
+        name: str,
+        max_hp: int,
+        max_sp: int,
+        atk: int,
+        rcv: int,
+        speed: int,
+        action_count: int,
+        skills: List[Skill],
+        status_effects: List[StatusEffect],
+        hp: Optional[int] = None,
+        sp: Optional[int] = None,
+    ) -> "Character":
+        """Build a Character without the dataclass ``__init__``/``__post_init__``.
+
+        For bulk loading: arguments are assumed to be already converted to the
+        right types.  Every slot must be set here.
+        """
+        obj = object.__new__(cls)
+        obj.name = name
+        obj.max_hp = max_hp
+        obj.max_sp = max_sp
+        obj.atk = atk
+        obj.rcv = rcv
+        obj.speed = speed
+        obj.action_count = action_count
+        obj.skills = skills
+        obj.status_effects = status_effects
+        obj.hp = max_hp if hp is None else hp
+        obj.sp = max_sp if sp is None else sp
+        return obj
 
     # ------------------------------------------------------------------
     # Battle helpers
@@ -89,6 +126,8 @@ class Character:
 
     def apply_status(self, status: "StatusEffect") -> None:
         """Apply a status effect, refreshing it if it already exists."""
+        # A character carries only a handful of effects, so a linear scan of
+        # the list is cheap and cannot go stale the way a separate index can
         for existing in self.status_effects:
             if existing.name == status.name:
                 existing.magnitude = status.magnitude
@@ -96,6 +135,20 @@ class Character:
                 return
         self.status_effects.append(status)
 
+    def tick_status_effects(self) -> None:
+        """Remove expired status effects, then decrement the remaining durations.
+
+        Done in a single in-place pass over ``status_effects``.
+        """
+        effects = self.status_effects
+        write = 0
+        for se in effects:
+            if se.duration > 0:
+                se.duration -= 1
+                effects[write] = se
+                write += 1
+        del effects[write:]
+
     # ------------------------------------------------------------------
     # Serialisation
     # ------------------------------------------------------------------
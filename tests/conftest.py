@@ -0,0 +1,80 @@
+"""Shared pytest fixtures."""
+
+import importlib
+import os
+
+import pytest
+
+from rpg.models import Character, Effect, Skill
+
+
+def _load_character(kind: str) -> type:
+    if kind == "pure":
+        return Character
+    # RPG_COMPILED names a module providing a compiled drop-in Character
+    return importlib.import_module(os.environ["RPG_COMPILED"]).Character
+
+
+@pytest.fixture(params=["pure", "compiled"])
+def character_cls(request):
+    """The Character class under test, pure Python and (opt-in) compiled."""
+    if request.param == "compiled" and not os.getenv("RPG_COMPILED"):
+        pytest.skip("set RPG_COMPILED=<module> to test a compiled Character")
+    return _load_character(request.param)
+
+
+@pytest.fixture(scope="session")
+def char_defaults():
+    """Constructor arguments for a plain test Character."""
+    return {
+        "name": "Test",
+        "max_hp": 100,
+        "max_sp": 50,
+        "atk": 20,
+        "rcv": 15,
+        "speed": 10,
+        "action_count": 1,
+    }
+
+
+@pytest.fixture(scope="session")
+def make_char(char_defaults):
+    """Factory building a fresh Character from the defaults plus overrides."""
+    def _make_char(**kwargs) -> Character:
+        return Character(**{**char_defaults, **kwargs})
+    return _make_char
+
+
+@pytest.fixture(scope="session")
+def pristine_char(make_char):
+    """A Character shared by the whole session; tests must not mutate it.
+
+    Tests that only change scalar fields (hp, sp, ...) can work on a
+    ``copy.copy`` of it.  The copy shares the skills and status lists, so
+    tests that apply statuses should use ``make_char`` instead.
+    """
+    return make_char()
+
+
+# Serialised forms are invariant, so they are built once per session and
+# shared by the read-only to_dict tests.
+
+
+@pytest.fixture(scope="session")
+def damage_effect_dict():
+    return Effect("damage", 1.5).to_dict()
+
+
+@pytest.fixture(scope="session")
+def status_effect_dict():
+    return Effect("status", 0.5, "poison").to_dict()
+
+
+@pytest.fixture(scope="session")
+def slash_skill_dict():
+    return Skill(name="Slash", effects=[Effect("damage", 1.0)]).to_dict()
+
+
+@pytest.fixture(scope="session")
+def default_char_dict(pristine_char):
+    return pristine_char.to_dict()
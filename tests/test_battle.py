@@ -1,7 +1,9 @@
 """Tests for rpg.battle and rpg.loader."""
 
+import io
 import json
 import os
+import sys
 import tempfile
 
 import pytest
@@ -67,6 +69,14 @@ def test_load_effect_from_dict_status():
     assert e.status_name == "burn"
 
 
+def test_loader_interns_names():
+    raw = '{"name": "Poison Dart", "effects": [{"effect_type": "status", "coefficient": 0.5, "status_name": "poison"}]}'
+    s = load_skill_from_dict(json.loads(raw))
+    assert s.name is sys.intern("Poison Dart")
+    assert s.effects[0].effect_type is sys.intern("status")
+    assert s.effects[0].status_name is sys.intern("poison")
+
+
 def test_load_skill_from_dict():
     s = load_skill_from_dict({
         "name": "Slash",
@@ -87,6 +97,34 @@ def test_load_character_from_dict():
     assert c.hp == 50
 
 
+def test_duplicate_named_statuses_expire_without_error():
+    c = load_character_from_dict({
+        "name": "Goblin", "max_hp": 50, "max_sp": 20,
+        "atk": 12, "rcv": 8, "speed": 8, "action_count": 1,
+        "skills": [{"name": "Slash", "effects": [{"effect_type": "damage", "coefficient": 0.0}]}],
+        "status_effects": [
+            {"name": "poison", "magnitude": 0.5, "duration": 0},
+            {"name": "poison", "magnitude": 0.9, "duration": 3},
+        ],
+    })
+    c.tick_status_effects()
+    assert [(se.name, se.duration) for se in c.status_effects] == [("poison", 2)]
+    # The surviving entry keeps its index key, so re-applying refreshes it
+    c.apply_status(StatusEffect(name="poison", magnitude=0.1, duration=5))
+    assert [(se.magnitude, se.duration) for se in c.status_effects] == [(0.1, 5)]
+
+    player = make_char("Hero", max_hp=100, atk=0, speed=10, skills=[damage_skill(coefficient=0.0)])
+    enemy = load_character_from_dict({
+        "name": "Goblin", "max_hp": 50, "max_sp": 20,
+        "atk": 0, "rcv": 8, "speed": 8, "action_count": 1,
+        "status_effects": [
+            {"name": "poison", "magnitude": 0.5, "duration": 1},
+            {"name": "poison", "magnitude": 0.9, "duration": 2},
+        ],
+    })
+    assert Battle(player, [enemy]).run()["result"] == "draw"
+
+
 def test_load_character_from_dict_custom_hp():
     c = load_character_from_dict({
         "name": "Goblin", "max_hp": 50, "max_sp": 20, "hp": 30,
@@ -177,6 +215,91 @@ def test_each_turn_has_status_at_start():
         assert "turn" in turn
 
 
+def test_static_stats_logged_once():
+    player = make_char("Hero", max_hp=100, atk=20, speed=10, skills=[damage_skill()])
+    enemy = make_char("Slime", max_hp=40, atk=8, speed=5, skills=[damage_skill()])
+    result = Battle(player, [enemy]).run()
+    assert [c["name"] for c in result["characters"]] == ["Hero", "Slime"]
+    assert result["characters"][0]["max_hp"] == 100
+    assert result["characters"][0]["skills"] == [damage_skill().to_dict()]
+    snapshot = result["turns"][0]["status_at_start"][0]
+    assert set(snapshot) == {"name", "hp", "sp", "status_effects"}
+
+
+def test_run_streaming_matches_run():
+    def roster():
+        return (
+            make_char("Hero", max_hp=100, atk=20, speed=10,
+                      skills=[damage_skill(), status_skill()]),
+            [make_char("Slime", max_hp=40, atk=8, speed=5, skills=[damage_skill()])],
+        )
+
+    expected = Battle(*roster()).run()
+    out = io.BytesIO()
+    result = Battle(*roster()).run_streaming(out)
+    assert result == expected["result"]
+    assert json.loads(out.getvalue()) == expected
+
+
+def test_skills_changed_after_construction_are_used():
+    player = make_char("Hero", max_hp=100, rcv=15, atk=20, speed=10,
+                       skills=[damage_skill("A1"), damage_skill("A2")])
+    enemy = make_char("Slime", max_hp=500, atk=1, speed=5, skills=[damage_skill()])
+    battle = Battle(player, [enemy])
+    player.skills = [heal_skill("H")]
+    result = battle.run()
+    hero_action = result["turns"][0]["actions"][0]
+    assert hero_action["skill"]["name"] == "H"
+    assert hero_action["effects"][0]["effect_type"] == "heal"
+    assert result["characters"][0]["skills"] == [heal_skill("H").to_dict()]
+
+
+def test_hp_changed_after_construction_is_used():
+    player = make_char("Hero", max_hp=100, atk=20, speed=10, skills=[damage_skill()])
+    enemies = [
+        make_char("Slime", max_hp=40, atk=1, speed=5, skills=[damage_skill()]),
+        make_char("Goblin", max_hp=40, atk=1, speed=4, skills=[damage_skill()]),
+    ]
+    battle = Battle(player, enemies)
+    enemies[0].hp = 0
+    enemies[1].hp = 0
+    result = battle.run()
+    assert result["result"] == "player_win"
+    assert result["turns"] == []
+
+
+def test_speed_changed_after_construction_is_used():
+    player = make_char("Hero", max_hp=100, atk=20, speed=1, skills=[damage_skill()])
+    enemy = make_char("Slime", max_hp=500, atk=1, speed=10, skills=[damage_skill()])
+    battle = Battle(player, [enemy])
+    player.speed = 50
+    result = battle.run()
+    assert [a["actor"] for a in result["turns"][0]["actions"]] == ["Hero", "Slime"]
+
+
+def test_second_run_does_not_change_first_result():
+    player = make_char("Hero", max_hp=200, atk=100, speed=10, skills=[damage_skill()])
+    enemy = make_char("Slime", max_hp=30, atk=5, speed=1, skills=[damage_skill()])
+    battle = Battle(player, [enemy])
+    first = battle.run()
+    n_turns = len(first["turns"])
+    battle.run()
+    assert n_turns == 1
+    assert len(first["turns"]) == n_turns
+
+
+def test_logged_skill_dicts_do_not_alias_models_or_other_runs():
+    player = make_char("Hero", max_hp=200, atk=100, speed=10, skills=[damage_skill("Slash")])
+    enemy = make_char("Slime", max_hp=30, atk=5, speed=1, skills=[damage_skill()])
+    battle = Battle(player, [enemy])
+    first = battle.run()
+    first["turns"][0]["actions"][0]["skill"]["name"] = "HACK"
+    enemy.hp = enemy.max_hp
+    second = battle.run()
+    assert player.skills[0].to_dict()["name"] == "Slash"
+    assert second["turns"][0]["actions"][0]["skill"] == player.skills[0].to_dict()
+
+
 # ---------------------------------------------------------------------------
 # Battle – damage effect
 # ---------------------------------------------------------------------------
@@ -245,6 +368,18 @@ def test_player_defeats_multiple_enemies():
     assert result["result"] == "player_win"
 
 
+def test_player_targets_next_enemy_after_kill():
+    player = make_char("Hero", max_hp=500, atk=30, speed=20,
+                       skills=[Skill("Double", [Effect("damage", 1.0), Effect("damage", 1.0)])])
+    enemies = [
+        make_char("Slime", max_hp=30, atk=1, speed=1, skills=[damage_skill()]),
+        make_char("Goblin", max_hp=100, atk=1, speed=2, skills=[damage_skill()]),
+    ]
+    result = Battle(player, enemies).run()
+    hero_action = result["turns"][0]["actions"][0]
+    assert [e["target"] for e in hero_action["effects"]] == ["Slime", "Goblin"]
+
+
 # ---------------------------------------------------------------------------
 # Battle – action_count tracks actions and rotates skills
 # ---------------------------------------------------------------------------
@@ -292,3 +427,46 @@ def test_draw_when_no_one_dies():
                        skills=[damage_skill(coefficient=0.0)])
     result = Battle(player, [enemy]).run()
     assert result["result"] == "draw"
+
+
+# ---------------------------------------------------------------------------
+# Battle – compiled fast path
+# ---------------------------------------------------------------------------
+
+
+def _fast_path_rosters():
+    return [
+        (make_char("Hero", max_hp=200, atk=100, speed=10, skills=[damage_skill()]),
+         [make_char("Slime", max_hp=30, atk=5, speed=1, skills=[damage_skill()])]),
+        (make_char("Hero", max_hp=10, atk=1, speed=1, skills=[damage_skill(coefficient=0.01)]),
+         [make_char("Dragon", max_hp=500, atk=200, speed=20, skills=[damage_skill()])]),
+        (make_char("Hero", max_hp=300, atk=25, rcv=30, speed=5,
+                   skills=[damage_skill(), heal_skill(), status_skill()]),
+         [make_char("Slime", max_hp=60, atk=15, speed=8, skills=[damage_skill()]),
+          make_char("Goblin", max_hp=90, atk=20, speed=2, skills=[damage_skill(coefficient=1.5)])]),
+        (make_char("Hero", max_hp=1000, atk=0, speed=10, skills=[damage_skill(coefficient=0.0)]),
+         [make_char("Dummy", max_hp=1000, atk=0, speed=1, skills=[damage_skill(coefficient=0.0)])]),
+    ]
+
+
+@pytest.mark.parametrize("case", range(4), ids=["win", "lose", "mixed", "draw"])
+def test_run_fast_matches_run(case):
+    pytest.importorskip("numpy")
+    player, enemies = _fast_path_rosters()[case]
+    expected = Battle(player, enemies).run()
+    expected_state = [(c.hp, c.action_count) for c in [player] + enemies]
+
+    player, enemies = _fast_path_rosters()[case]
+    result = Battle(player, enemies).run_fast()
+    assert result == {"result": expected["result"]}
+    assert [(c.hp, c.action_count) for c in [player] + enemies] == expected_state
+
+
+def test_run_fast_uses_speed_changed_after_construction():
+    pytest.importorskip("numpy")
+    # Whoever strikes first wins, so the outcome shows the acting order
+    player = make_char("Hero", max_hp=10, atk=100, speed=1, skills=[damage_skill()])
+    enemy = make_char("Slime", max_hp=30, atk=50, speed=10, skills=[damage_skill()])
+    battle = Battle(player, [enemy])
+    player.speed = 50
+    assert battle.run_fast() == {"result": "player_win"}
@@ -0,0 +1,71 @@
+"""Tests for rpg.jsonio."""
+
+import json
+
+import pytest
+
+import rpg.jsonio
+from rpg.jsonio import dumps, loads
+from rpg.models import Character, Effect, Skill, StatusEffect
+
+
+@pytest.fixture
+def stdlib_json(monkeypatch):
+    """Force the standard-library fallback, as when orjson is not installed."""
+    monkeypatch.setattr(rpg.jsonio, "orjson", None)
+
+
+def _sample():
+    skill = Skill(name="Slash", effects=[Effect("status", 0.5, "poison")])
+    char = Character(name="スライム", max_hp=30, max_sp=0, atk=5, rcv=0, speed=1,
+                     action_count=1, skills=[skill],
+                     status_effects=[StatusEffect(name="poison", magnitude=0.5, duration=2)])
+    return {"result": "draw", "characters": [char], "turns": [{"turn": 1, "actions": []}]}
+
+
+def test_dumps_returns_utf8_bytes():
+    out = dumps({"name": "スライム"})
+    assert isinstance(out, bytes)
+    assert json.loads(out.decode("utf-8")) == {"name": "スライム"}
+
+
+def test_dumps_serialises_models_via_to_dict():
+    skill = Skill(name="Slash", effects=[Effect("damage", 1.2)])
+    assert json.loads(dumps([skill], indent=True)) == [skill.to_dict()]
+
+
+def test_dumps_rejects_unknown_objects():
+    with pytest.raises(TypeError):
+        dumps(object())
+
+
+def test_loads_round_trips_dumps():
+    obj = {"name": "スライム", "hp": [1, 2.5, None]}
+    assert loads(dumps(obj)) == obj
+
+
+
+@pytest.mark.parametrize("indent", [False, True], ids=["compact", "indented"])
+def test_stdlib_dumps_serialises_models_via_to_dict(stdlib_json, indent):
+    obj = _sample()
+    expected = {**obj, "characters": [c.to_dict() for c in obj["characters"]]}
+    assert json.loads(dumps(obj, indent=indent)) == expected
+
+
+@pytest.mark.parametrize("indent", [False, True], ids=["compact", "indented"])
+def test_stdlib_dumps_matches_orjson(monkeypatch, indent):
+    pytest.importorskip("orjson")
+    expected = dumps(_sample(), indent=indent)
+    monkeypatch.setattr(rpg.jsonio, "orjson", None)
+    assert dumps(_sample(), indent=indent) == expected
+
+
+def test_stdlib_dumps_rejects_unknown_objects(stdlib_json):
+    with pytest.raises(TypeError):
+        dumps(object())
+
+
+def test_stdlib_loads_round_trips_dumps(stdlib_json):
+    obj = {"name": "スライム", "hp": [1, 2.5, None]}
+    assert loads(dumps(obj)) == obj
+    assert loads(dumps(obj).decode("utf-8")) == obj
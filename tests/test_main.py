@@ -0,0 +1,72 @@
+"""Tests for the command-line option parsing in main.py."""
+
+import pytest
+
+from main import _parse_args
+
+SKILLS = "data/example_skills.json"
+
+
+def test_defaults():
+    args = _parse_args([])
+    assert args["skills"] is None
+    assert args["output"] == "battle"
+    assert args["player"].endswith("player.json")
+    assert args["enemies"].endswith("enemies.json")
+
+
+@pytest.mark.parametrize("argv", [["-h"], ["--help"], ["--skills", SKILLS, "-h"]],
+                         ids=["short", "long", "after_option"])
+def test_help_prints_usage_and_exits(capsys, argv):
+    with pytest.raises(SystemExit) as exc:
+        _parse_args(argv)
+    assert exc.value.code == 0
+    assert capsys.readouterr().out.startswith("usage: main.py")
+
+
+@pytest.mark.parametrize(
+    "argv, key, value",
+    [
+        (["--skills", SKILLS], "skills", SKILLS),
+        (["--skills=" + SKILLS], "skills", SKILLS),
+        (["-s", SKILLS], "skills", SKILLS),
+        (["-s" + SKILLS], "skills", SKILLS),
+        (["-s=" + SKILLS], "skills", SKILLS),
+        (["-o=enemy_info"], "output", "enemy_info"),
+        (["--out", "enemy_info"], "output", "enemy_info"),
+        (["--out=enemy_info"], "output", "enemy_info"),
+        (["-p", "-1"], "player", "-1"),
+    ],
+    ids=["long", "long_equals", "short", "short_attached", "short_equals",
+         "short_equals_output", "long_prefix", "long_prefix_equals", "negative_number"],
+)
+def test_option_forms(argv, key, value):
+    assert _parse_args(argv)[key] == value
+
+
+def test_later_option_wins():
+    assert _parse_args(["-o", "enemy_info", "--output", "battle"])["output"] == "battle"
+
+
+@pytest.mark.parametrize(
+    "argv, message",
+    [
+        (["--skills", "-o", "battle"], "argument --skills/-s: expected one argument"),
+        (["--skills"], "argument --skills/-s: expected one argument"),
+        (["--output", "fight"], "argument --output/-o: invalid choice: 'fight'"),
+        (["--bogus"], "unrecognized arguments: --bogus"),
+        (["--bogus", "value"], "unrecognized arguments: --bogus value"),
+        (["-o", "battle", "stray"], "unrecognized arguments: stray"),
+        (["--", "-o", "battle"], "unrecognized arguments: -- -o battle"),
+    ],
+    ids=["missing_value_before_option", "missing_value_at_end", "invalid_choice",
+         "unknown_option", "unknown_option_with_value", "stray_positional",
+         "after_double_dash"],
+)
+def test_usage_errors(capsys, argv, message):
+    with pytest.raises(SystemExit) as exc:
+        _parse_args(argv)
+    assert exc.value.code == 2
+    err = capsys.readouterr().err
+    assert err.startswith("usage: main.py")
+    assert f"main.py: error: {message}" in err
@@ -1,25 +1,35 @@
 """Tests for rpg.models."""
 
+import copy
+import dataclasses
+
 import pytest
 from rpg.models import Character, Effect, Skill, StatusEffect
 
 
+_EXPECTED_CHAR_KEYS = frozenset({
+    "name", "hp", "max_hp", "sp", "max_sp", "atk", "rcv", "speed",
+    "action_count", "skills", "status_effects",
+})
+
+# Prototype statuses; copy with dataclasses.replace before applying
+POISON_LIGHT = StatusEffect("poison", 0.3, 2)
+POISON_HEAVY = StatusEffect("poison", 0.7, 5)
+BURN = StatusEffect("burn", 1.0, 2)
+
+
 # ---------------------------------------------------------------------------
 # Effect
 # ---------------------------------------------------------------------------
 
 
-def test_effect_to_dict_damage():
-    e = Effect(effect_type="damage", coefficient=1.5)
-    d = e.to_dict()
-    assert d == {"effect_type": "damage", "coefficient": 1.5}
-    assert "status_name" not in d
+def test_effect_to_dict_damage(damage_effect_dict):
+    assert damage_effect_dict == {"effect_type": "damage", "coefficient": 1.5}
+    assert "status_name" not in damage_effect_dict
 
 
-def test_effect_to_dict_status():
-    e = Effect(effect_type="status", coefficient=0.5, status_name="poison")
-    d = e.to_dict()
-    assert d["status_name"] == "poison"
+def test_effect_to_dict_status(status_effect_dict):
+    assert status_effect_dict["status_name"] == "poison"
 
 
 # ---------------------------------------------------------------------------
@@ -27,11 +37,15 @@ def test_effect_to_dict_status():
 # ---------------------------------------------------------------------------
 
 
-def test_skill_to_dict():
+def test_skill_to_dict(slash_skill_dict):
+    assert slash_skill_dict["name"] == "Slash"
+    assert len(slash_skill_dict["effects"]) == 1
+
+
+def test_skill_to_dict_returns_independent_dict():
     skill = Skill(name="Slash", effects=[Effect("damage", 1.0)])
-    d = skill.to_dict()
-    assert d["name"] == "Slash"
-    assert len(d["effects"]) == 1
+    skill.to_dict()["name"] = "HACK"
+    assert skill.to_dict()["name"] == "Slash"
 
 
 # ---------------------------------------------------------------------------
@@ -39,28 +53,38 @@ def test_skill_to_dict():
 # ---------------------------------------------------------------------------
 
 
-def make_char(**kwargs) -> Character:
-    defaults = dict(
-        name="Test",
-        max_hp=100,
-        max_sp=50,
-        atk=20,
-        rcv=15,
-        speed=10,
-        action_count=1,
-    )
-    defaults.update(kwargs)
-    return Character(**defaults)
+def test_character_initial_hp_equals_max_hp(character_cls, char_defaults):
+    c = character_cls(**{**char_defaults, "max_hp": 80})
+    assert c.hp == 80
 
 
-def test_character_initial_hp_equals_max_hp():
-    c = make_char(max_hp=80)
-    assert c.hp == 80
+def test_character_fast_new_matches_init(make_char):
+    effects = [StatusEffect(name="poison", magnitude=0.5, duration=3)]
+    fast = Character._fast_new("Test", 100, 50, 20, 15, 10, 1, [], effects, hp=40)
+    slow = make_char(status_effects=list(effects))
+    slow.hp = 40
+    assert fast == slow
+    assert fast.sp == 50
+    fast.apply_status(StatusEffect(name="poison", magnitude=0.9, duration=1))
+    assert len(fast.status_effects) == 1
+
+
+def test_character_fast_new_sets_every_slot():
+    fast = Character._fast_new("Test", 100, 50, 20, 15, 10, 1, [], [])
+    missing = [name for name in Character.__slots__ if not hasattr(fast, name)]
+    assert missing == []
 
 
-def test_character_is_alive():
+def test_character_uses_slots(make_char):
     c = make_char()
-    assert c.is_alive()
+    assert not hasattr(c, "__dict__")
+    c.hp = 10
+    assert c.hp == 10
+
+
+def test_character_is_alive(pristine_char):
+    assert pristine_char.is_alive()
+    c = copy.copy(pristine_char)
     c.hp = 0
     assert not c.is_alive()
 
@@ -70,26 +94,16 @@ def test_character_is_alive():
 # ---------------------------------------------------------------------------
 
 
-def test_take_damage_normal():
-    c = make_char(max_hp=100)
-    actual = c.take_damage(30)
-    assert actual == 30
-    assert c.hp == 70
-
-
-def test_take_damage_cannot_go_below_zero():
-    c = make_char(max_hp=100)
-    c.hp = 20
-    actual = c.take_damage(50)
-    assert actual == 20
-    assert c.hp == 0
-
-
-def test_take_damage_negative_clamped_to_zero():
-    c = make_char(max_hp=100)
-    actual = c.take_damage(-10)
-    assert actual == 0
-    assert c.hp == 100
+@pytest.mark.parametrize(
+    "start_hp, dmg, actual, final",
+    [(100, 30, 30, 70), (20, 50, 20, 0), (100, -10, 0, 100)],
+    ids=["normal", "cannot_go_below_zero", "negative_clamped_to_zero"],
+)
+def test_take_damage(pristine_char, start_hp, dmg, actual, final):
+    c = copy.copy(pristine_char)  # max_hp=100; only scalars are mutated
+    c.hp = start_hp
+    assert c.take_damage(dmg) == actual
+    assert c.hp == final
 
 
 # ---------------------------------------------------------------------------
@@ -97,28 +111,16 @@ def test_take_damage_negative_clamped_to_zero():
 # ---------------------------------------------------------------------------
 
 
-def test_heal_hp_normal():
-    c = make_char(max_hp=100)
-    c.hp = 60
-    actual = c.heal_hp(20)
-    assert actual == 20
-    assert c.hp == 80
-
-
-def test_heal_hp_cannot_exceed_max():
-    c = make_char(max_hp=100)
-    c.hp = 90
-    actual = c.heal_hp(50)
-    assert actual == 10
-    assert c.hp == 100
-
-
-def test_heal_hp_negative_clamped_to_zero():
-    c = make_char(max_hp=100)
-    c.hp = 50
-    actual = c.heal_hp(-5)
-    assert actual == 0
-    assert c.hp == 50
+@pytest.mark.parametrize(
+    "start_hp, amount, actual, final",
+    [(60, 20, 20, 80), (90, 50, 10, 100), (50, -5, 0, 50)],
+    ids=["normal", "cannot_exceed_max", "negative_clamped_to_zero"],
+)
+def test_heal_hp(pristine_char, start_hp, amount, actual, final):
+    c = copy.copy(pristine_char)  # max_hp=100; only scalars are mutated
+    c.hp = start_hp
+    assert c.heal_hp(amount) == actual
+    assert c.hp == final
 
 
 # ---------------------------------------------------------------------------
@@ -126,28 +128,47 @@ def test_heal_hp_negative_clamped_to_zero():
 # ---------------------------------------------------------------------------
 
 
-def test_apply_status_adds_new():
+@pytest.mark.parametrize(
+    "applied, expected",
+    [
+        ([POISON_LIGHT], [("poison", 0.3, 2)]),
+        ([POISON_LIGHT, POISON_HEAVY], [("poison", 0.7, 5)]),
+        ([POISON_LIGHT, BURN], [("poison", 0.3, 2), ("burn", 1.0, 2)]),
+    ],
+    ids=["adds_new", "refreshes_existing", "different_effects_stack"],
+)
+def test_apply_status(make_char, applied, expected):
     c = make_char()
-    se = StatusEffect(name="poison", magnitude=0.5, duration=3)
-    c.apply_status(se)
-    assert len(c.status_effects) == 1
-    assert c.status_effects[0].name == "poison"
+    for status in applied:
+        # apply_status keeps and later mutates the object, so pass a copy
+        c.apply_status(dataclasses.replace(status))
+    assert [(se.name, se.magnitude, se.duration) for se in c.status_effects] == expected
 
 
-def test_apply_status_refreshes_existing():
+def test_tick_status_effects_expires_and_decrements(make_char):
     c = make_char()
-    c.apply_status(StatusEffect(name="poison", magnitude=0.3, duration=2))
-    c.apply_status(StatusEffect(name="poison", magnitude=0.7, duration=5))
-    assert len(c.status_effects) == 1
-    assert c.status_effects[0].magnitude == 0.7
-    assert c.status_effects[0].duration == 5
+    c.apply_status(StatusEffect(name="poison", magnitude=0.5, duration=1))
+    c.apply_status(StatusEffect(name="burn", magnitude=1.0, duration=0))
+    c.tick_status_effects()
+    assert [(se.name, se.duration) for se in c.status_effects] == [("poison", 0)]
+    c.tick_status_effects()
+    assert c.status_effects == []
+    # Re-applying after expiry adds a fresh entry
+    c.apply_status(StatusEffect(name="burn", magnitude=1.0, duration=2))
+    assert [se.name for se in c.status_effects] == ["burn"]
 
 
-def test_apply_status_different_effects_stack():
+@pytest.mark.parametrize(
+    "reset",
+    [lambda c: setattr(c, "status_effects", []), lambda c: c.status_effects.clear()],
+    ids=["reassigned", "cleared"],
+)
+def test_apply_status_after_status_list_reset(make_char, reset):
     c = make_char()
-    c.apply_status(StatusEffect(name="poison", magnitude=0.5, duration=3))
-    c.apply_status(StatusEffect(name="burn", magnitude=1.0, duration=2))
-    assert len(c.status_effects) == 2
+    c.apply_status(dataclasses.replace(POISON_LIGHT))
+    reset(c)
+    c.apply_status(dataclasses.replace(POISON_HEAVY))
+    assert [(se.name, se.magnitude, se.duration) for se in c.status_effects] == [("poison", 0.7, 5)]
 
 
 # ---------------------------------------------------------------------------
@@ -155,9 +176,17 @@ def test_apply_status_different_effects_stack():
 # ---------------------------------------------------------------------------
 
 
-def test_character_to_dict_keys():
+def test_character_to_dict_keys(default_char_dict):
+    # Set difference so a failure names the missing keys
+    assert not (_EXPECTED_CHAR_KEYS - default_char_dict.keys())
+
+
+def test_character_to_dict_reflects_direct_mutation(make_char):
     c = make_char()
+    c.skills.append(Skill(name="Slash"))
+    c.max_hp = 99
+    c.to_dict()["name"] = "HACK"
     d = c.to_dict()
-    for key in ("name", "hp", "max_hp", "sp", "max_sp", "atk", "rcv", "speed",
-                "action_count", "skills", "status_effects"):
-        assert key in d
+    assert d["name"] == "Test"
+    assert d["max_hp"] == 99
+    assert [s["name"] for s in d["skills"]] == ["Slash"]